@@ -5,46 +5,247 @@ MultiMind - Project Orchestration Tool
 A local orchestration tool for coordinating multiple projects that depend on one another.
 """
 
-import argparse
+import errno
+import io
 import json
 import os
-import shutil
+import re
+import stat
 import sys
-from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+# argparse, shutil, datetime, concurrent.futures and orjson are imported
+# inside the functions that need them, so quick commands such as "version"
+# start faster
+if TYPE_CHECKING:
+    import argparse
 
 # Configuration file path
 CONFIG_FILE = "MultiMindPM/config.json"
 VERSION = "0.6.1"  # Updated version number
 
+# PM directories that per-project paths are built under
+PM_REPORTS_DIR = "MultiMindPM/reports"
+PM_ADVISORIES_DIR = "MultiMindPM/advisories"
+
+# Template for the per-project scripts/complete_phase.py
+COMPLETION_TEMPLATE = "MultiMindPM/templates/complete_phase.py"
+
+# Upper bound on worker threads for per-project file operations
+MAX_WORKERS = 8
+
+# Set by the -q/--quiet option to suppress per-file progress lines
+QUIET = False
+
 # Template project names
-TEMPLATE_PROJECTS = ["ProjectOne", "ProjectTwo", "ProjectThree"]
+TEMPLATE_PROJECTS = frozenset(("ProjectOne", "ProjectTwo", "ProjectThree"))
+
+# Top-level config keys added by index_projects and never saved
+INDEX_KEYS = frozenset(("_by_name", "_by_name_lower"))
+
+# Shared encoder for writing the config file
+CONFIG_ENCODER = json.JSONEncoder(indent=2, check_circular=False)
+
+# Default completion marker written by report_completion, pre-encoded so
+# it can be filled in and written as bytes
+COMPLETION_MARKER_TMPL = b"""# Project Completion: %(name)s - %(phase)s
+
+Version: 0.1.0
+Completed: %(today)s
+Project: %(name)s
+Phase: %(phase)s
+
+## Completed Directives
+
+* Completion reported via command line
+* See status report for details
+
+## Notes
+
+Generated automatically by multimind.py complete command.
+
+## Next Phase
+
+Awaiting PM review and new directives.
+"""
+
+# Header lines of handoff, advisory and completion documents. Headers sit
+# at the top of the file, so only the first HEADER_BYTES bytes are searched.
+STATUS_RE = re.compile(rb'(?m)^Status:[ \t]*(.*?)\s*$')
+COMPLETED_RE = re.compile(rb'(?m)^Completed:[ \t]*(.*?)\s*$')
+HEADER_BYTES = 4096
+
+# Placeholders filled in when rendering the phase summary template
+SUMMARY_PLACEHOLDER_RE = re.compile(r"\[(Project Name|Phase ID|YYYY-MM-DD)\]")
+
+# Emoji shown next to each handoff status in the handoff listing
+STATUS_ICONS = {"PENDING": "⏳", "COMPLETED": "✅", "REJECTED": "❌", "ACCEPTED": "✓"}
+
+# Files at least this large use the large-buffer fallback copy
+LARGE_COPY_BYTES = 2 << 20
+
+# File templates used by init_project (formatted with name and today)
+README_TMPL = "# {name}\n\nVersion: 0.1.0\n\n## Overview\n\nDescription of {name} goes here.\n"
+
+STATUS_TMPL = "# {name} Status Report\n\nVersion: 0.1.0\n\n## Last Update\n\n{today}\n\n## Current Progress\n\n* Project initialized\n\n## Blockers\n\n* None at this time\n\n## Next Steps\n\n* Define project requirements\n"
+
+MAIN_TMPL = """#!/usr/bin/env python3
+\"\"\"
+Main module for {name}.
+\"\"\"
+
+def main():
+    \"\"\"Main entry point for the application.\"\"\"
+    print("Hello from {name}!")
+
+if __name__ == "__main__":
+    main()
+"""
+
+DIRECTIVE_TMPL = """# {name} Directives
+
+Version: 0.1.0
+
+## Current Tasks
+
+1. Define project requirements
+
+## Implementation Guidelines
+
+- Follow the coding standards defined in `/rules/coding_standards.md`
+- Create appropriate unit tests for all functionality
+- Document your code and APIs
+
+## Completion Reporting - IMPORTANT
+
+When you have completed all the tasks in this directive:
+
+1. Update your status report in `/reports/status.md` with details of what you've accomplished
+2. Create a completion marker file in `/output/completions/{name}-Phase1-complete.md` following the format in `/rules/completion_reporting.md`
+3. Run the following command to notify the Project Manager:
+   ```bash
+   ./multimind.py complete {name} Phase1
+   ```
+   
+   Or use the local completion script from your project directory:
+   ```bash
+   python scripts/complete_phase.py Phase1
+   ```
+   
+This completion reporting is a critical part of the MultiMind workflow and must be performed when the phase is complete.
+"""
+
+
+@lru_cache(maxsize=None)
+def _orjson():
+    """
+    Import orjson on first use.
+    
+    Returns:
+        The orjson module, or None if it is not installed, in which case the
+        standard json module is used instead
+    """
+    try:
+        import orjson
+    except ImportError:  # Optional: fall back to the standard json module
+        return None
+    return orjson
 
 
 def load_config() -> Dict:
     """Load the configuration from the config file."""
+    orjson = _orjson()
     try:
-        with open(CONFIG_FILE, "r") as f:
-            return json.load(f)
+        data = Path(CONFIG_FILE).read_bytes()
+        config = orjson.loads(data) if orjson else json.loads(data)
     except FileNotFoundError:
         print(f"Error: Config file not found at {CONFIG_FILE}")
         sys.exit(1)
-    except json.JSONDecodeError:
+    except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses this
         print(f"Error: Config file {CONFIG_FILE} is not valid JSON")
         sys.exit(1)
+    index_projects(config)
+    return config
+
+
+def save_config(config: Dict) -> None:
+    """
+    Save the configuration to the config file.
+    
+    The config is serialized in one pass (with orjson when installed,
+    otherwise the shared encoder) and written with a single call, rather
+    than streaming many small chunks through json.dump.
+    """
+    # Skip the entries added by index_projects; any other keys, including
+    # hand-written ones starting with "_", are saved as they are
+    public = {k: v for k, v in config.items() if k not in INDEX_KEYS}
+    if "projects" in config:
+        public["projects"] = [{k: v for k, v in p.items() if k != "_name_lc"}
+                              for p in config["projects"]]
+    orjson = _orjson()
+    if orjson:
+        data = orjson.dumps(public, option=orjson.OPT_INDENT_2)
+    else:
+        data = CONFIG_ENCODER.encode(public).encode()
+    Path(CONFIG_FILE).write_bytes(data)
 
 
+def index_projects(config: Dict) -> None:
+    """
+    Build the exact and case-insensitive project name indexes used by find_project.
+    
+    Each project also gets its lowercased name cached under "_name_lc".
+    Must be called again after config["projects"] is modified.
+    """
+    for p in config["projects"]:
+        p["_name_lc"] = p["name"].lower()
+    config["_by_name"] = {p["name"]: p for p in config["projects"]}
+    config["_by_name_lower"] = {p["_name_lc"]: p for p in config["projects"]}
+
+
+def find_project(config: Dict, project_name: str, exact: bool = False) -> Dict:
+    """
+    Look up a project entry by name, ignoring case unless exact is set.
+    
+    Returns:
+        The project entry, or None if no project has that name
+    """
+    if "_by_name" not in config:
+        index_projects(config)
+    if exact:
+        return config["_by_name"].get(project_name)
+    return config["_by_name_lower"].get(project_name.lower())
+
+
+# Today's date, computed on first use by _today()
+_TODAY = None
+
+
+def _today() -> str:
+    """Return today's date as YYYY-MM-DD, reading the clock once per run."""
+    global _TODAY
+    if _TODAY is None:
+        from datetime import datetime
+        _TODAY = datetime.now().strftime('%Y-%m-%d')
+    return _TODAY
+
+
+@lru_cache(maxsize=None)
 def is_template_project(project_name: str) -> bool:
     """Check if a project is a template project."""
     return project_name in TEMPLATE_PROJECTS
 
 
+@lru_cache(maxsize=None)
 def is_active_project(project_name: str, project_path: str) -> bool:
     """
     Check if a project is an active project with content.
     
     A project is considered active if it has a status report or other meaningful content.
+    Results are cached; call is_active_project.cache_clear() before a pass
+    that should see status reports created since the last check.
     """
     # Skip template projects completely if they don't have actual content
     if is_template_project(project_name):
@@ -53,132 +254,460 @@ def is_active_project(project_name: str, project_path: str) -> bool:
     return True
 
 
-def ensure_dirs(project_path: str, dir_name: str) -> None:
-    """Ensure that the required directories exist."""
-    path = os.path.join(project_path, dir_name)
+def active_projects(config: Dict) -> List[Dict]:
+    """
+    Return the active project entries, skipping template projects without content.
+    
+    The per-project checks are memoized by is_active_project, so repeated
+    filtering does not re-check the filesystem and stays in step with
+    is_active_project.cache_clear().
+    """
+    return [p for p in config["projects"] if is_active_project(p["name"], p["path"])]
+
+
+# Directories already created (or found to exist) during this run
+_DIR_CACHE = set()
+
+
+def _mkdirs(path: str) -> None:
+    """
+    Create a directory and any missing parents, once per run.
+    
+    Repeat requests for the same path, or for any of its ancestors, skip
+    the makedirs syscalls.
+    """
+    if path in _DIR_CACHE:
+        return
     os.makedirs(path, exist_ok=True)
+    while path and path not in _DIR_CACHE:
+        _DIR_CACHE.add(path)
+        path = os.path.dirname(path)
 
 
-def sync_files(config: Dict) -> None:
+def _scan_md(directory: str, files_only: bool = False) -> List[os.DirEntry]:
     """
-    Synchronize files from the PM directory to the project directories.
+    List the Markdown files in a directory with a single os.scandir pass.
     
-    This includes:
-    - README.md
-    - roadmap.md
-    - Project-specific directive files
-    - .cursor-ai-instructions.md (for AI onboarding)
-    - rules/ directory (coding standards, etc.)
-    - advisories/ directory (PM responses to project questions)
+    The returned DirEntry objects carry the joined path and cache their
+    stat() result, so callers do not need separate join/exists/getmtime calls.
+    With files_only, entries that are not regular files (such as a directory
+    named *.md) are skipped using the type scandir already read.
     """
-    print("🔄 Syncing files from PM to projects...")
+    with os.scandir(directory) as it:
+        if files_only:
+            return [entry for entry in it if entry.name[-3:] == ".md" and entry.is_file()]
+        return [entry for entry in it if entry.name[-3:] == ".md"]
+
+
+@lru_cache(maxsize=16)
+def _read_template_bytes(path: str, mtime_ns: int) -> bytes:
+    """Read a template file; cached per path and modification time."""
+    return Path(path).read_bytes()
+
+
+def _load_template(path: str) -> bytes:
+    """
+    Return the raw content of a template file.
     
-    total_synced = 0
+    Repeat loads within one process are served from memory until the
+    file's modification time changes.
     
-    for project in config["projects"]:
-        project_name = project["name"]
-        project_path = project["path"]
-        directive_file = project["directive_file"]
+    Raises:
+        FileNotFoundError: If the template does not exist
+    """
+    return _read_template_bytes(path, os.stat(path).st_mtime_ns)
+
+
+def _read_header_field(path: str, pattern) -> Optional[str]:
+    """
+    Read a header field such as "Status:" from the start of a document.
+    
+    Args:
+        path: Path to the document
+        pattern: Compiled bytes regex whose first group captures the value
         
-        # Skip inactive template projects
-        if not is_active_project(project_name, project_path):
+    Returns:
+        The stripped field value, or None if it is missing or unreadable
+    """
+    try:
+        # Unbuffered: the header is fetched with one read() into one bytes object
+        with open(path, 'rb', buffering=0) as f:
+            match = pattern.search(f.read(HEADER_BYTES))
+        return match.group(1).decode().strip() if match else None
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _is_newer(src_st: os.stat_result, dest: str) -> bool:
+    """
+    Check whether a source file should be copied over dest.
+    
+    Costs a single stat of dest; the source stat is supplied by the caller.
+    
+    Returns:
+        bool: True if dest does not exist or is older than the source
+    """
+    try:
+        return src_st.st_mtime_ns > os.stat(dest).st_mtime_ns
+    except FileNotFoundError:
+        return True
+
+
+def _needs_copy(src_st: os.stat_result, dest) -> bool:
+    """
+    Check whether dest differs from the source, rsync-style.
+    
+    Only metadata is compared: dest is considered up to date when it has the
+    same size and is at least as new as the source.
+    
+    Returns:
+        bool: True if dest is missing, a different size, or older than the source
+    """
+    try:
+        dest_st = os.stat(dest)
+    except FileNotFoundError:
+        return True
+    return (src_st.st_size != dest_st.st_size or
+            src_st.st_mtime_ns > dest_st.st_mtime_ns)
+
+
+def _kernel_copy(src_fd: int, dst_fd: int, size: int) -> bool:
+    """
+    Copy size bytes between file descriptors without a user-space buffer.
+    
+    Tries os.copy_file_range and then os.sendfile. Returns False if neither
+    is usable for these files, in which case nothing has been written.
+    """
+    for name in ("copy_file_range", "sendfile"):
+        if not hasattr(os, name):
             continue
+        offset = 0
+        try:
+            while offset < size:
+                if name == "copy_file_range":
+                    sent = os.copy_file_range(src_fd, dst_fd, size - offset, offset, offset)
+                else:
+                    sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+            if offset == 0 and size > 0:
+                # Nothing copied from a non-empty file: some filesystems
+                # (procfs, FUSE, network mounts) report EOF here instead of
+                # failing, so treat the method as unsupported
+                continue
+            return True
+        except OSError:
+            # Unsupported for these files; try the next method unless
+            # data has already been written
+            if offset:
+                raise
+    return False
+
+
+def _write_bytes(path: str, data: bytes, mode: int = 0o666) -> None:
+    """
+    Write data to a file through a raw file descriptor.
+    
+    Skips the text and buffering layers of open(). A new file is created
+    with the given mode (subject to the umask), by default the same as
+    open(); an existing file keeps its mode.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _copy_large(src, dst) -> None:
+    """
+    Copy a large file through a reused 1 MiB buffer with readinto.
+    
+    Used instead of shutil.copyfile, whose smaller default buffer costs more
+    read/write round trips, when the kernel copy paths are unavailable.
+    """
+    buf = bytearray(1 << 20)
+    mv = memoryview(buf)
+    with open(src, 'rb') as r, open(dst, 'wb') as w:
+        while True:
+            n = r.readinto(mv)
+            if not n:
+                break
+            w.write(mv[:n])
+
+
+def _fast_copy(src, dst, src_st: os.stat_result = None, preserve_mtime: bool = False) -> None:
+    """
+    Copy a file's contents.
+    
+    The data is copied inside the kernel where possible, falling back to
+    shutil.copyfile (or _copy_large for big files) otherwise. Permission
+    bits are not copied; new files are created with the default mode, as
+    with open().
+    
+    Args:
+        src: Source file path
+        dst: Destination file path
+        src_st: Stat result for src, if already known, to avoid another stat
+        preserve_mtime: Give dst the source's access and modification times,
+            so later _is_newer/_needs_copy checks see the two as in sync
+    
+    Raises:
+        IsADirectoryError: If src is a directory; dst is left untouched
+        OSError: If src is another kind of non-regular file
+    """
+    if src_st is None:
+        src_st = os.stat(src)
+    # Check before opening anything: opening a named pipe would block, and
+    # opening a directory read-only succeeds and would create dst
+    if not stat.S_ISREG(src_st.st_mode):
+        if stat.S_ISDIR(src_st.st_mode):
+            raise IsADirectoryError(errno.EISDIR, os.strerror(errno.EISDIR), str(src))
+        raise OSError(f"Not a regular file: {src}")
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            copied = _kernel_copy(src_fd, dst_fd, src_st.st_size)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    
+    if not copied:
+        if src_st.st_size >= LARGE_COPY_BYTES:
+            _copy_large(src, dst)
+        else:
+            import shutil
+            shutil.copyfile(src, dst)
+    
+    if preserve_mtime:
+        os.utime(dst, ns=(src_st.st_atime_ns, src_st.st_mtime_ns))
+
+
+def _copy_if_exists(src, dst) -> bool:
+    """
+    Copy src to dst unless src is missing, without a separate existence check.
+    
+    The destination directory must already exist.
+    
+    Returns:
+        bool: True if the file was copied, False if the source is missing
+    """
+    try:
+        _fast_copy(src, dst)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def _maybe_copy(src, dst, log: List[str], copied_msg: str, missing_msg: str = None) -> bool:
+    """
+    Copy a file if it exists and dest is not up to date, recording the outcome in the log.
+    
+    The source is checked with a single stat call so that the common case
+    of an optional file being absent does not raise and catch an exception.
+    An up-to-date dest (see _needs_copy) is left untouched and logs nothing;
+    otherwise dest's directory is created if needed before copying.
+    
+    Args:
+        src: Source file path
+        dst: Destination file path
+        log: List of output lines to append to
+        copied_msg: Line to record when the file is copied (unless quiet)
+        missing_msg: Line to record when the source is missing (optional)
         
-        print(f"\n📂 Syncing to {project_name}...")
-        project_synced = 0
+    Returns:
+        bool: True if dest now matches the source, False if the source is missing
+    """
+    try:
+        src_st = os.stat(src)
+    except FileNotFoundError:
+        if missing_msg:
+            log.append(missing_msg)
+        return False
+    
+    if _needs_copy(src_st, dst):
+        _mkdirs(os.path.dirname(dst))
+        _fast_copy(src, dst, src_st, preserve_mtime=True)
+        if not QUIET:
+            log.append(copied_msg)
+    return True
+
+
+def _run_per_project(func, projects: List[Dict]) -> int:
+    """
+    Run a per-project task for every project concurrently.
+    
+    Each task returns a count and its output lines. Projects are independent
+    and the work is I/O-bound, so a thread pool lets their file operations
+    overlap. Output is written to stdout in one call, in config order.
+    
+    Args:
+        func: Callable taking a project entry and returning (count, lines)
+        projects: The project entries from the configuration
         
-        # Ensure directories exist
-        ensure_dirs(project_path, "directives")
-        ensure_dirs(project_path, "reports")
-        ensure_dirs(project_path, "rules")
-        ensure_dirs(project_path, "advisories")
+    Returns:
+        int: Sum of the counts returned by each task
+    """
+    if not projects:
+        return 0
+    
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(projects))) as executor:
+        results = list(executor.map(func, projects))
+    
+    total = 0
+    buf = io.StringIO()
+    for count, log in results:
+        for line in log:
+            buf.write(line + "\n")
+        total += count
+    sys.stdout.write(buf.getvalue())
+    return total
+
+
+def _sync_project(project: Dict, rules_entries: List[os.DirEntry] = None) -> Tuple[int, List[str]]:
+    """
+    Synchronize PM files into a single project directory.
+    
+    Output lines are collected rather than printed so that projects can be
+    synced concurrently without interleaving their messages.
+    
+    Args:
+        project: The project entry from the configuration
+        rules_entries: Rule files scanned once by sync_files, or None if the
+            PM rules directory does not exist
         
-        # Copy README.md
-        try:
-            shutil.copy("MultiMindPM/README.md", os.path.join(project_path, "README.md"))
-            print(f"  ✓ README.md → {project_path}/README.md")
+    Returns:
+        Tuple of the number of items synced and the output lines
+    """
+    project_name = project["name"]
+    project_path = project["path"]
+    directive_file = project["directive_file"]
+    
+    # Skip inactive template projects
+    if not is_active_project(project_name, project_path):
+        return 0, []
+    
+    log = [f"\n📂 Syncing to {project_name}..."]
+    project_synced = 0
+    ppath = Path(project_path)
+    pm = Path("MultiMindPM")
+    
+    # Destination directories are created only when something is copied
+    # into them (see _maybe_copy and the rules loop below)
+    
+    # Copy README.md
+    try:
+        if _maybe_copy(pm / "README.md", ppath / "README.md", log,
+                       f"  ✓ README.md → {project_path}/README.md",
+                       f"  ⚠️ Warning: MultiMindPM/README.md not found"):
             project_synced += 1
-        except FileNotFoundError:
-            print(f"  ⚠️ Warning: MultiMindPM/README.md not found")
-        except Exception as e:
-            print(f"  ❌ Error copying README.md: {e}")
-        
-        # Copy roadmap.md
-        try:
-            # Check if project-specific roadmap exists
-            project_roadmap = f"MultiMindPM/roadmaps/{project_name.lower()}_roadmap.md"
-            if os.path.exists(project_roadmap):
-                # Use project-specific roadmap
-                shutil.copy(project_roadmap, os.path.join(project_path, "roadmap.md"))
-                print(f"  ✓ {project_roadmap} → {project_path}/roadmap.md")
-                project_synced += 1
-            else:
-                # Fallback to main roadmap
-                main_roadmap = "MultiMindPM/roadmap.md"
-                if os.path.exists(main_roadmap):
-                    shutil.copy(main_roadmap, os.path.join(project_path, "roadmap.md"))
-                    print(f"  ✓ roadmap.md → {project_path}/roadmap.md")
-                    project_synced += 1
-                else:
-                    print(f"  ⚠️ Warning: No roadmap file found for {project_name}")
-        except Exception as e:
-            print(f"  ❌ Error copying roadmap: {e}")
-        
-        # Copy directive file
-        try:
-            source = os.path.join("MultiMindPM/directives", directive_file)
-            dest = os.path.join(project_path, "directives", directive_file)
-            if os.path.exists(source):
-                shutil.copy(source, dest)
-                print(f"  ✓ {source} → {dest}")
-                project_synced += 1
-            else:
-                print(f"  ⚠️ Warning: Directive file {source} not found")
-        except Exception as e:
-            print(f"  ❌ Error copying directive file: {e}")
-            
-        # Copy .cursor-ai-instructions.md
-        try:
-            # Check if project-specific Cursor instructions exist
-            cursor_instructions = f"{project_path}/.cursor-ai-instructions.md"
-            if os.path.exists(cursor_instructions):
-                # No need to copy, it's already in the right place
-                print(f"  ℹ️ Using existing {cursor_instructions}")
-            else:
-                # No project-specific instructions found, let's see if there's a template
-                template_path = f"MultiMindPM/.cursor-ai-templates/{project_name}-ai-instructions.md"
-                if os.path.exists(template_path):
-                    shutil.copy(template_path, cursor_instructions)
-                    print(f"  ✓ {template_path} → {cursor_instructions}")
-                    project_synced += 1
-        except Exception as e:
-            print(f"  ⚠️ Warning: Issue with cursor instructions: {e}")
-            
-        # Copy rules
-        try:
-            rules_dir = "MultiMindPM/rules"
-            rules_copied = 0
-            if os.path.exists(rules_dir) and os.path.isdir(rules_dir):
-                for rule_file in os.listdir(rules_dir):
-                    if rule_file.endswith(".md"):
-                        source = os.path.join(rules_dir, rule_file)
-                        dest = os.path.join(project_path, "rules", rule_file)
-                        shutil.copy(source, dest)
-                        rules_copied += 1
-                if rules_copied > 0:
-                    print(f"  ✓ Copied {rules_copied} rule files to {project_path}/rules/")
-                    project_synced += 1
-            else:
-                print(f"  ⚠️ Warning: Rules directory not found")
-        except Exception as e:
-            print(f"  ❌ Error copying rules: {e}")
+    except Exception as e:
+        log.append(f"  ❌ Error copying README.md: {e}")
+    
+    # Copy roadmap.md
+    try:
+        # Prefer a project-specific roadmap, falling back to the main roadmap
+        # The cached lowercase name is only present once index_projects has run
+        name_lc = project.get("_name_lc") or project_name.lower()
+        project_roadmap = pm / "roadmaps" / f"{name_lc}_roadmap.md"
+        if (_maybe_copy(project_roadmap, ppath / "roadmap.md", log,
+                        f"  ✓ {project_roadmap} → {project_path}/roadmap.md") or
+                _maybe_copy(pm / "roadmap.md", ppath / "roadmap.md", log,
+                            f"  ✓ roadmap.md → {project_path}/roadmap.md",
+                            f"  ⚠️ Warning: No roadmap file found for {project_name}")):
+            project_synced += 1
+    except Exception as e:
+        log.append(f"  ❌ Error copying roadmap: {e}")
+    
+    # Copy directive file
+    try:
+        source = pm / "directives" / directive_file
+        dest = ppath / "directives" / directive_file
+        if _maybe_copy(source, dest, log, f"  ✓ {source} → {dest}",
+                       f"  ⚠️ Warning: Directive file {source} not found"):
+            project_synced += 1
+    except Exception as e:
+        log.append(f"  ❌ Error copying directive file: {e}")
         
-        total_synced += project_synced
+    # Copy .cursor-ai-instructions.md
+    try:
+        # Check if project-specific Cursor instructions exist
+        cursor_instructions = ppath / ".cursor-ai-instructions.md"
+        if cursor_instructions.exists():
+            # No need to copy, it's already in the right place
+            if not QUIET:
+                log.append(f"  ℹ️ Using existing {cursor_instructions}")
+        else:
+            # No project-specific instructions found, let's see if there's a template
+            template_path = pm / ".cursor-ai-templates" / f"{project_name}-ai-instructions.md"
+            if _maybe_copy(template_path, cursor_instructions, log,
+                           f"  ✓ {template_path} → {cursor_instructions}"):
+                project_synced += 1
+    except Exception as e:
+        log.append(f"  ⚠️ Warning: Issue with cursor instructions: {e}")
         
-        if project_synced > 0:
-            print(f"  ✅ Synced {project_synced} items to {project_name}")
+    # Copy rules
+    try:
+        rules_copied = 0
+        if rules_entries is not None:
+            dest_rules_dir = os.path.join(project_path, "rules")
+            dest_rules_prefix = dest_rules_dir + os.sep
+            for entry in rules_entries:
+                src_st = entry.stat()
+                dest = dest_rules_prefix + entry.name
+                if _needs_copy(src_st, dest):
+                    _mkdirs(dest_rules_dir)
+                    _fast_copy(entry.path, dest, src_st, preserve_mtime=True)
+                    rules_copied += 1
+            if rules_copied > 0:
+                log.append(f"  ✓ Copied {rules_copied} rule files to {project_path}/rules/")
+            if rules_entries:
+                project_synced += 1
         else:
-            print(f"  ⚠️ No files were synced to {project_name}")
+            log.append(f"  ⚠️ Warning: Rules directory not found")
+    except Exception as e:
+        log.append(f"  ❌ Error copying rules: {e}")
+    
+    if project_synced > 0:
+        log.append(f"  ✅ Synced {project_synced} items to {project_name}")
+    else:
+        log.append(f"  ⚠️ No files were synced to {project_name}")
+    
+    return project_synced, log
+
+
+def sync_files(config: Dict) -> None:
+    """
+    Synchronize files from the PM directory to the project directories.
+    
+    This includes:
+    - README.md
+    - roadmap.md
+    - Project-specific directive files
+    - .cursor-ai-instructions.md (for AI onboarding)
+    - rules/ directory (coding standards, etc.)
+    - advisories/ directory (PM responses to project questions)
+    """
+    print("🔄 Syncing files from PM to projects...")
+    is_active_project.cache_clear()
+    
+    # The rules directory is the same for every project, so list and stat
+    # it once up front rather than once per project
+    rules_dir = "MultiMindPM/rules"
+    rules_entries = None
+    if os.path.isdir(rules_dir):
+        rules_entries = _scan_md(rules_dir)
+        for entry in rules_entries:
+            entry.stat()
+    
+    total_synced = _run_per_project(
+        partial(_sync_project, rules_entries=rules_entries), config["projects"])
     
     # Process advisories
     advisories_synced = handle_advisories(config)
@@ -196,39 +725,55 @@ def sync_files(config: Dict) -> None:
         print(f"   Check that you have active projects and that your PM files exist.")
 
 
+def _gather_project(project: Dict) -> Tuple[int, List[str]]:
+    """
+    Copy a single project's status report to the PM reports directory.
+    
+    Args:
+        project: The project entry from the configuration
+        
+    Returns:
+        Tuple of the number of reports gathered (0 or 1) and the output lines
+    """
+    project_name = project["name"]
+    project_path = project["path"]
+    status_file = project["status_file"]
+    
+    # Skip inactive template projects
+    if not is_active_project(project_name, project_path):
+        return 0, []
+    
+    log = [f"\n📋 Gathering report from {project_name}..."]
+    
+    # Copy status.md to PM reports directory
+    source = os.path.join(project_path, "reports/status.md")
+    dest = f"{PM_REPORTS_DIR}/{status_file}"
+    
+    try:
+        try:
+            src_st = os.stat(source)
+        except FileNotFoundError:
+            src_st = None
+        if src_st is not None:
+            _fast_copy(source, dest, src_st)
+            if not QUIET:
+                log.append(f"  ✓ {source} → {dest}")
+            return 1, log
+        log.append(f"  ⚠️ Warning: Status report not found at {source}")
+        log.append(f"     Project should create a status report to provide updates on progress.")
+    except Exception as e:
+        log.append(f"  ❌ Error copying status report: {e}")
+    return 0, log
+
+
 def gather_reports(config: Dict) -> None:
     """
     Gather status reports from project directories to the PM directory.
     """
     print("📥 Gathering status reports from projects...")
+    is_active_project.cache_clear()
     
-    reports_gathered = 0
-    
-    for project in config["projects"]:
-        project_name = project["name"]
-        project_path = project["path"]
-        status_file = project["status_file"]
-        
-        # Skip inactive template projects
-        if not is_active_project(project_name, project_path):
-            continue
-        
-        print(f"\n📋 Gathering report from {project_name}...")
-        
-        # Copy status.md to PM reports directory
-        source = os.path.join(project_path, "reports/status.md")
-        dest = os.path.join("MultiMindPM/reports", status_file)
-        
-        try:
-            if os.path.exists(source):
-                shutil.copy(source, dest)
-                print(f"  ✓ {source} → {dest}")
-                reports_gathered += 1
-            else:
-                print(f"  ⚠️ Warning: Status report not found at {source}")
-                print(f"     Project should create a status report to provide updates on progress.")
-        except Exception as e:
-            print(f"  ❌ Error copying status report: {e}")
+    reports_gathered = _run_per_project(_gather_project, config["projects"])
     
     # Process advisories (gather from projects to PM)
     advisories_synced = handle_advisories(config)
@@ -255,57 +800,44 @@ def handle_handoffs(config: Dict) -> None:
     # Ensure handoff directories exist
     pm_handoffs_dir = "MultiMindPM/handoffs"
     output_handoffs_dir = "output/handoffs"
-    os.makedirs(pm_handoffs_dir, exist_ok=True)
-    os.makedirs(output_handoffs_dir, exist_ok=True)
+    _mkdirs(pm_handoffs_dir)
+    _mkdirs(output_handoffs_dir)
+    
+    pm_prefix = pm_handoffs_dir + os.sep
     
     # Check for new handoffs in output directory
     new_handoffs = []
+    log_lines = []
     try:
-        for handoff_file in os.listdir(output_handoffs_dir):
-            if handoff_file.endswith(".md"):
-                source = os.path.join(output_handoffs_dir, handoff_file)
-                dest = os.path.join(pm_handoffs_dir, handoff_file)
-                
-                # Only copy if it doesn't exist in PM directory or is newer
-                if (not os.path.exists(dest) or 
-                    os.path.getmtime(source) > os.path.getmtime(dest)):
-                    shutil.copy(source, dest)
-                    new_handoffs.append(handoff_file)
-                    print(f"  ✓ New handoff: {handoff_file}")
+        for entry in _scan_md(output_handoffs_dir):
+            dest = pm_prefix + entry.name
+            src_st = entry.stat()
+            
+            # Only copy if it doesn't exist in PM directory or is newer
+            if _is_newer(src_st, dest):
+                _fast_copy(entry.path, dest, src_st, preserve_mtime=True)
+                new_handoffs.append(entry.name)
+                if not QUIET:
+                    log_lines.append(f"  ✓ New handoff: {entry.name}\n")
     except Exception as e:
-        print(f"  ❌ Error processing handoffs: {e}")
+        log_lines.append(f"  ❌ Error processing handoffs: {e}\n")
+    sys.stdout.writelines(log_lines)
     
     # List all current handoffs
     handoffs = []
     if os.path.exists(pm_handoffs_dir):
-        for handoff_file in os.listdir(pm_handoffs_dir):
-            if handoff_file.endswith(".md"):
-                handoffs.append(handoff_file)
+        handoffs = [entry.name for entry in _scan_md(pm_handoffs_dir)]
     
     if handoffs:
         print("\n📋 Current handoffs:")
         for handoff in sorted(handoffs):
             # Try to extract status from the file
-            status = "UNKNOWN"
-            try:
-                with open(os.path.join(pm_handoffs_dir, handoff), 'r') as f:
-                    for line in f:
-                        if line.startswith("Status:"):
-                            status = line.strip().split("Status:")[1].strip()
-                            break
-            except:
-                pass
+            status = _read_header_field(pm_prefix + handoff, STATUS_RE)
+            if status is None:
+                status = "UNKNOWN"
             
             # Apply emoji based on status
-            status_icon = "❓"  # Default unknown
-            if status.upper() == "PENDING":
-                status_icon = "⏳"
-            elif status.upper() == "COMPLETED":
-                status_icon = "✅"
-            elif status.upper() == "REJECTED":
-                status_icon = "❌"
-            elif status.upper() == "ACCEPTED":
-                status_icon = "✓"
+            status_icon = STATUS_ICONS.get(status.upper(), "❓")
             
             print(f"  • {handoff} {status_icon} [{status}]")
         
@@ -321,7 +853,8 @@ def handle_handoffs(config: Dict) -> None:
         print(f"\n✅ Handoff processing complete! No new handoffs found.")
 
 
-def report_completion(config: Dict, project_name: str, phase_id: str, only_project: bool = False) -> None:
+def report_completion(config: Dict, project_name: str, phase_id: str, only_project: bool = False,
+                      today: str = None) -> None:
     """
     Process and record a project phase completion.
     
@@ -336,24 +869,21 @@ def report_completion(config: Dict, project_name: str, phase_id: str, only_proje
         project_name: Name of the project that completed a phase
         phase_id: Identifier for the completed phase
         only_project: If True, only show completions for the specified project
+        today: Date string (YYYY-MM-DD) for a generated completion marker;
+            defaults to _today()
     """
     print(f"Processing completion report for {project_name} - {phase_id}...")
     
     # Validate project exists
-    project_found = False
-    project_path = ""
-    for project in config["projects"]:
-        if project["name"].lower() == project_name.lower():
-            project_found = True
-            project_path = project["path"]
-            project_name = project["name"]  # Use correct case
-            break
-    
-    if not project_found:
+    project = find_project(config, project_name)
+    if project is None:
         print(f"Error: Project '{project_name}' not found in config")
         print("Please check the project name and try again.")
-        print(f"Available projects: {', '.join(p['name'] for p in config['projects'] if is_active_project(p['name'], p['path']))}")
+        print(f"Available projects: {', '.join(p['name'] for p in active_projects(config))}")
         return
+    
+    project_path = project["path"]
+    project_name = project["name"]  # Use correct case
         
     # Check if the project is active
     if not is_active_project(project_name, project_path):
@@ -365,8 +895,8 @@ def report_completion(config: Dict, project_name: str, phase_id: str, only_proje
     # Ensure completions directories exist
     pm_completions_dir = "MultiMindPM/completions"
     output_completions_dir = "output/completions"
-    os.makedirs(pm_completions_dir, exist_ok=True)
-    os.makedirs(output_completions_dir, exist_ok=True)
+    _mkdirs(pm_completions_dir)
+    _mkdirs(output_completions_dir)
     
     # Define completion filename
     completion_file = f"{project_name}-{phase_id}-complete.md"
@@ -376,98 +906,68 @@ def report_completion(config: Dict, project_name: str, phase_id: str, only_proje
     # Check if completion marker exists
     if os.path.exists(source_path):
         # Copy to PM directory
-        shutil.copy(source_path, dest_path)
+        _fast_copy(source_path, dest_path)
         print(f"  ✓ Completion marker copied: {source_path} → {dest_path}")
     else:
         # Create a basic completion marker
-        today = datetime.now().strftime('%Y-%m-%d')
-        with open(dest_path, 'w') as f:
-            f.write(f"""# Project Completion: {project_name} - {phase_id}
-
-Version: 0.1.0
-Completed: {today}
-Project: {project_name}
-Phase: {phase_id}
-
-## Completed Directives
-
-* Completion reported via command line
-* See status report for details
-
-## Notes
-
-Generated automatically by multimind.py complete command.
-
-## Next Phase
-
-Awaiting PM review and new directives.
-""")
+        if today is None:
+            today = _today()
+        Path(dest_path).write_bytes(COMPLETION_MARKER_TMPL % {
+            b"name": project_name.encode(),
+            b"phase": phase_id.encode(),
+            b"today": today.encode(),
+        })
         print(f"  ✓ Created basic completion marker: {dest_path}")
         print(f"  ℹ️ Note: In the future, create your own completion marker in advance for more detailed reporting.")
         print(f"     See MultiMindPM/rules/completion_reporting.md for the proper format.")
     
     # Gather status report
     print(f"  ⟳ Collecting status report...")
-    status_file = None
-    for project in config["projects"]:
-        if project["name"] == project_name:
-            status_file = project["status_file"]
-            break
-    
+    status_file = project["status_file"]
     if status_file:
         source = os.path.join(project_path, "reports/status.md")
-        dest = os.path.join("MultiMindPM/reports", status_file)
+        dest = f"{PM_REPORTS_DIR}/{status_file}"
         try:
-            shutil.copy(source, dest)
+            _fast_copy(source, dest)
             print(f"  ✓ Status report updated: {source} → {dest}")
         except FileNotFoundError:
             print(f"  ⚠️ Warning: Status report not found at {source}")
             print(f"     Please create a status report to provide context for your completion.")
     
-    # List all current completions
+    # List all current completions (format: ProjectName-PhaseID-complete.md),
+    # filtered by project if specified. The directory was created above.
+    name_prefix = f"{project_name}-" if only_project else ""
+    with os.scandir(pm_completions_dir) as it:
+        candidates = [entry.name for entry in it
+                      if entry.name.endswith("-complete.md") and entry.name.startswith(name_prefix)]
+    
+    # Skip template projects that don't have active development
     completions = []
-    if os.path.exists(pm_completions_dir):
-        for file in os.listdir(pm_completions_dir):
-            if file.endswith("-complete.md"):
-                # Filter by project if specified
-                if only_project and not file.startswith(f"{project_name}-"):
-                    continue
-                    
-                # Get project name from filename (format: ProjectName-PhaseID-complete.md)
-                file_project = file.split("-")[0]
-                
-                # Skip template projects that don't have active development
-                project_path = ""
-                for p in config["projects"]:
-                    if p["name"] == file_project:
-                        project_path = p["path"]
-                        break
-                        
-                if not is_active_project(file_project, project_path):
-                    continue
-                        
-                completions.append(file)
+    for file in candidates:
+        file_project = file.split("-", 1)[0]
+        p = find_project(config, file_project, exact=True)
+        project_path = p["path"] if p else ""
+        if is_active_project(file_project, project_path):
+            completions.append(file)
+    completions.sort()
     
     if completions:
         print("\n📋 Current phase completions:")
-        for completion in sorted(completions):
+        completions_prefix = pm_completions_dir + os.sep
+        lines = []
+        for completion in completions:
             # Try to extract date from the file
-            date = "Unknown date"
-            try:
-                with open(os.path.join(pm_completions_dir, completion), 'r') as f:
-                    for line in f:
-                        if line.startswith("Completed:"):
-                            date = line.strip().split("Completed:")[1].strip()
-                            break
-            except:
-                pass
+            date = _read_header_field(completions_prefix + completion, COMPLETED_RE)
+            if date is None:
+                date = "Unknown date"
             
-            print(f"  • {completion} [{date}]")
+            lines.append(f"  • {completion} [{date}]\n")
+        sys.stdout.writelines(lines)
     else:
         print("\n📋 No completions found for active projects.")
     
     # Archive the phase materials
-    archive_phase(config, project_name, phase_id)
+    archive_phase(config, project_name, phase_id, today=today)
     
     print("\n✅ Completion report processed!")
     print("\n📌 Next steps:")
@@ -476,57 +976,47 @@ Awaiting PM review and new directives.
     print("  3. Begin work on the next phase once new directives are available")
 
 
-def init_project(config: Dict, project_name: str) -> None:
+def init_project(config: Dict, project_name: str, today: str = None) -> None:
     """
     Initialize a new project with the standard directory structure.
     
     Args:
         config: The configuration dictionary
         project_name: Name of the new project
+        today: Date string (YYYY-MM-DD) for generated files; defaults to _today()
     """
     print(f"Initializing new project: {project_name}")
     
-    # Create project directory
+    # Create project directory and standard directories. Only leaf
+    # directories are listed; their parents (the project directory and
+    # src/) are created implicitly.
     project_path = project_name
-    os.makedirs(project_path, exist_ok=True)
-    
-    # Create standard directories
-    dirs = ["directives", "reports", "rules", "src", "src/models", 
+    dirs = ["directives", "reports", "rules", "src/models",
             "src/utils", "src/tests", "advisories", "scripts"]
     
     for dir_name in dirs:
-        ensure_dirs(project_path, dir_name)
+        _mkdirs(os.path.join(project_path, dir_name))
     
     # Create basic files
-    with open(os.path.join(project_path, "README.md"), 'w') as f:
-        f.write(f"# {project_name}\n\nVersion: 0.1.0\n\n## Overview\n\nDescription of {project_name} goes here.\n")
-    
-    with open(os.path.join(project_path, "reports/status.md"), 'w') as f:
-        f.write(f"# {project_name} Status Report\n\nVersion: 0.1.0\n\n## Last Update\n\n{datetime.now().strftime('%Y-%m-%d')}\n\n## Current Progress\n\n* Project initialized\n\n## Blockers\n\n* None at this time\n\n## Next Steps\n\n* Define project requirements\n")
+    if today is None:
+        today = _today()
+    _write_bytes(os.path.join(project_path, "README.md"),
+                 README_TMPL.format(name=project_name).encode())
+    _write_bytes(os.path.join(project_path, "reports/status.md"),
+                 STATUS_TMPL.format(name=project_name, today=today).encode())
     
     # Create source files
-    with open(os.path.join(project_path, "src/main.py"), 'w') as f:
-        f.write(f"""#!/usr/bin/env python3
-\"\"\"
-Main module for {project_name}.
-\"\"\"
-
-def main():
-    \"\"\"Main entry point for the application.\"\"\"
-    print("Hello from {project_name}!")
-
-if __name__ == "__main__":
-    main()
-""")
+    _write_bytes(os.path.join(project_path, "src/main.py"),
+                 MAIN_TMPL.format(name=project_name).encode())
     
     # Create PM advisory directory for this project
-    pm_advisories_dir = os.path.join("MultiMindPM/advisories", project_name)
-    os.makedirs(pm_advisories_dir, exist_ok=True)
+    pm_advisories_dir = f"{PM_ADVISORIES_DIR}/{project_name}"
+    _mkdirs(pm_advisories_dir)
     
     # Create PM archive directory for this project
     pm_archives_dir = os.path.join("MultiMindPM/archives", project_name)
-    os.makedirs(pm_archives_dir, exist_ok=True)
-    os.makedirs(os.path.join(pm_archives_dir, "Phase1"), exist_ok=True)
+    _mkdirs(pm_archives_dir)
+    _mkdirs(os.path.join(pm_archives_dir, "Phase1"))
     
     print(f"Project {project_name} initialized successfully!")
     
@@ -535,39 +1025,8 @@ if __name__ == "__main__":
     status_file = f"{project_name.lower()}-status.md"
     
     # Create empty directive file with completion instructions
-    with open(os.path.join("MultiMindPM/directives", directive_file), 'w') as f:
-        f.write(f"""# {project_name} Directives
-
-Version: 0.1.0
-
-## Current Tasks
-
-1. Define project requirements
-
-## Implementation Guidelines
-
-- Follow the coding standards defined in `/rules/coding_standards.md`
-- Create appropriate unit tests for all functionality
-- Document your code and APIs
-
-## Completion Reporting - IMPORTANT
-
-When you have completed all the tasks in this directive:
-
-1. Update your status report in `/reports/status.md` with details of what you've accomplished
-2. Create a completion marker file in `/output/completions/{project_name}-Phase1-complete.md` following the format in `/rules/completion_reporting.md`
-3. Run the following command to notify the Project Manager:
-   ```bash
-   ./multimind.py complete {project_name} Phase1
-   ```
-   
-   Or use the local completion script from your project directory:
-   ```bash
-   python scripts/complete_phase.py Phase1
-   ```
-   
-This completion reporting is a critical part of the MultiMind workflow and must be performed when the phase is complete.
-""")
+    _write_bytes(os.path.join("MultiMindPM/directives", directive_file),
+                 DIRECTIVE_TMPL.format(name=project_name).encode())
     
     # Add to config
     config["projects"].append({
@@ -576,10 +1035,10 @@ This completion reporting is a critical part of the MultiMind workflow and must
         "directive_file": directive_file,
         "status_file": status_file
     })
+    index_projects(config)
     
     # Save updated config
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=2)
+    save_config(config)
     
     print(f"Configuration updated with new project: {project_name}")
     
@@ -588,6 +1047,75 @@ This completion reporting is a critical part of the MultiMind workflow and must
     create_completion_scripts(config, project_name)
 
 
+def _advise_project(project: Dict) -> Tuple[int, List[str]]:
+    """
+    Exchange advisories between the PM and a single project.
+    
+    Args:
+        project: Project entry from the configuration
+        
+    Returns:
+        Tuple of the number of advisories copied and the output lines
+    """
+    project_name = project["name"]
+    project_path = project["path"]
+    
+    # Skip inactive template projects
+    if not is_active_project(project_name, project_path):
+        return 0, []
+    
+    log = [f"Processing advisories for {project_name}..."]
+    
+    new_advisories = []
+    updated_advisories = []
+    try:
+        # Ensure project-specific directories exist; both are scanned below
+        # without further existence checks
+        pm_project_advisories_dir = f"{PM_ADVISORIES_DIR}/{project_name}"
+        project_advisories_dir = os.path.join(project_path, "advisories")
+        _mkdirs(pm_project_advisories_dir)
+        _mkdirs(project_advisories_dir)
+        pm_prefix = pm_project_advisories_dir + os.sep
+        project_prefix = project_advisories_dir + os.sep
+        
+        # Check for new advisories in project directory (to PM)
+        for entry in _scan_md(project_advisories_dir):
+            dest = pm_prefix + entry.name
+            try:
+                src_st = entry.stat()
+                
+                # Only copy if it doesn't exist in PM directory or is newer
+                if _is_newer(src_st, dest):
+                    _fast_copy(entry.path, dest, src_st, preserve_mtime=True)
+                    new_advisories.append(entry.name)
+                    if not QUIET:
+                        log.append(f"  + New advisory from project: {entry.name}")
+            except Exception as e:
+                log.append(f"  ❌ Error copying advisory {entry.name}: {e}")
+        
+        # Check for updated advisories in PM directory (to project)
+        for entry in _scan_md(pm_project_advisories_dir):
+            dest = project_prefix + entry.name
+            try:
+                src_st = entry.stat()
+                
+                # Only copy if newer than project's version
+                if _is_newer(src_st, dest):
+                    
+                    # Always copy from PM to project, regardless of content
+                    # This ensures directives, responses, and status updates flow to the project
+                    _fast_copy(entry.path, dest, src_st, preserve_mtime=True)
+                    updated_advisories.append(entry.name)
+                    if not QUIET:
+                        log.append(f"  + Updated advisory to project: {entry.name}")
+            except Exception as e:
+                log.append(f"  ❌ Error copying advisory {entry.name}: {e}")
+    except Exception as e:
+        log.append(f"  ❌ Error processing advisories: {e}")
+    
+    return len(new_advisories) + len(updated_advisories), log
+
+
 def handle_advisories(config: Dict) -> int:
     """
     Process advisory documents between the PM and projects.
@@ -599,61 +1127,11 @@ def handle_advisories(config: Dict) -> int:
     print("Processing advisories...")
     
     # Ensure PM advisories directory exists
-    pm_advisories_base_dir = "MultiMindPM/advisories"
-    os.makedirs(pm_advisories_base_dir, exist_ok=True)
+    pm_advisories_base_dir = PM_ADVISORIES_DIR
+    _mkdirs(pm_advisories_base_dir)
     
     # Process each project's advisories
-    advisories_synced = 0
-    for project in config["projects"]:
-        project_name = project["name"]
-        project_path = project["path"]
-        
-        # Skip inactive template projects
-        if not is_active_project(project_name, project_path):
-            continue
-            
-        print(f"Processing advisories for {project_name}...")
-        
-        # Ensure project-specific directories exist
-        pm_project_advisories_dir = os.path.join(pm_advisories_base_dir, project_name)
-        project_advisories_dir = os.path.join(project_path, "advisories")
-        os.makedirs(pm_project_advisories_dir, exist_ok=True)
-        os.makedirs(project_advisories_dir, exist_ok=True)
-        
-        # Check for new advisories in project directory (to PM)
-        new_advisories = []
-        if os.path.exists(project_advisories_dir):
-            for advisory_file in os.listdir(project_advisories_dir):
-                if advisory_file.endswith(".md"):
-                    source = os.path.join(project_advisories_dir, advisory_file)
-                    dest = os.path.join(pm_project_advisories_dir, advisory_file)
-                    
-                    # Only copy if it doesn't exist in PM directory or is newer
-                    if (not os.path.exists(dest) or 
-                        os.path.getmtime(source) > os.path.getmtime(dest)):
-                        shutil.copy(source, dest)
-                        new_advisories.append(advisory_file)
-                        print(f"  + New advisory from project: {advisory_file}")
-        
-        # Check for updated advisories in PM directory (to project)
-        updated_advisories = []
-        if os.path.exists(pm_project_advisories_dir):
-            for advisory_file in os.listdir(pm_project_advisories_dir):
-                if advisory_file.endswith(".md"):
-                    source = os.path.join(pm_project_advisories_dir, advisory_file)
-                    dest = os.path.join(project_advisories_dir, advisory_file)
-                    
-                    # Only copy if newer than project's version
-                    if (not os.path.exists(dest) or 
-                        os.path.getmtime(source) > os.path.getmtime(dest)):
-                        
-                        # Always copy from PM to project, regardless of content
-                        # This ensures directives, responses, and status updates flow to the project
-                        shutil.copy(source, dest)
-                        updated_advisories.append(advisory_file)
-                        print(f"  + Updated advisory to project: {advisory_file}")
-        
-        advisories_synced += len(new_advisories) + len(updated_advisories)
+    advisories_synced = _run_per_project(_advise_project, config["projects"])
     
     # List all current advisories organized by project and status
     print("\nCurrent advisories:")
@@ -662,49 +1140,40 @@ def handle_advisories(config: Dict) -> int:
         # Group advisories by project and status
         advisories_by_project = {}
         
-        for project_dir in os.listdir(pm_advisories_base_dir):
-            project_advisories_path = os.path.join(pm_advisories_base_dir, project_dir)
-            if os.path.isdir(project_advisories_path):
-                advisories_by_project[project_dir] = {"ASKED": [], "ANSWERED": [], "RESOLVED": []}
-                
-                for advisory_file in os.listdir(project_advisories_path):
-                    if advisory_file.endswith(".md"):
-                        # Extract status
-                        status = "UNKNOWN"
-                        try:
-                            with open(os.path.join(project_advisories_path, advisory_file), 'r') as f:
-                                for line in f:
-                                    if line.startswith("Status:"):
-                                        status = line.strip().split("Status:")[1].strip()
-                                        if status not in ["ASKED", "ANSWERED", "RESOLVED"]:
-                                            status = "UNKNOWN"
-                                        break
-                        except:
-                            pass
-                        
-                        if status in advisories_by_project[project_dir]:
-                            advisories_by_project[project_dir][status].append(advisory_file)
-                        else:
-                            advisories_by_project[project_dir]["ASKED"].append(advisory_file)
-        
-        # Print advisories by project and status
+        with os.scandir(pm_advisories_base_dir) as it:
+            project_dirs = [d for d in it if d.is_dir()]
+        for project_entry in project_dirs:
+            project_dir = project_entry.name
+            statuses = {"ASKED": [], "ANSWERED": [], "RESOLVED": []}
+            advisories_by_project[project_dir] = statuses
+            
+            for entry in _scan_md(project_entry.path):
+                # Extract status; missing or unknown statuses are listed as ASKED
+                status = _read_header_field(entry.path, STATUS_RE)
+                if status:
+                    status = status.upper()
+                statuses.get(status, statuses["ASKED"]).append(entry.name)
+    
+        # Print advisories by project and status in a single write
+        buf = io.StringIO()
         for project, statuses in advisories_by_project.items():
             has_advisories = sum(len(advisories) for advisories in statuses.values()) > 0
             if has_advisories:
-                print(f"  Project: {project}")
+                buf.write(f"  Project: {project}\n")
                 
                 for status, advisories in statuses.items():
                     if advisories:
-                        print(f"    {status}:")
+                        buf.write(f"    {status}:\n")
                         for advisory in sorted(advisories):
-                            print(f"      - {advisory}")
+                            buf.write(f"      - {advisory}\n")
+        sys.stdout.write(buf.getvalue())
     
     print("Advisory processing complete!")
     
     return advisories_synced
 
 
-def archive_phase(config: Dict, project_name: str, phase_id: str) -> None:
+def archive_phase(config: Dict, project_name: str, phase_id: str, today: str = None) -> None:
     """
     Archive completed phase materials.
     
@@ -712,177 +1181,200 @@ def archive_phase(config: Dict, project_name: str, phase_id: str) -> None:
         config: The configuration dictionary
         project_name: Name of the project
         phase_id: Identifier for the completed phase
+        today: Date string (YYYY-MM-DD) for the phase summary; defaults to _today()
     """
     print(f"\n📦 Archiving phase materials for {project_name} - {phase_id}...")
+    if today is None:
+        today = _today()
     
     # Ensure the project exists
-    project_found = False
-    project_path = ""
-    for project in config["projects"]:
-        if project["name"].lower() == project_name.lower():
-            project_found = True
-            project_path = project["path"]
-            project_name = project["name"]  # Use correct case
-            break
-    
-    if not project_found:
+    project = find_project(config, project_name)
+    if project is None:
         print(f"  ❌ Error: Project '{project_name}' not found in config")
         return
+    project_name = project["name"]  # Use correct case
     
-    # Ensure archive directory exists
-    archive_dir = f"MultiMindPM/archives/{project_name}/{phase_id}"
-    os.makedirs(archive_dir, exist_ok=True)
-    
-    archived_items = 0
-    
-    # Archive completion report
-    completion_file = f"{project_name}-{phase_id}-complete.md"
-    completion_path = os.path.join("MultiMindPM/completions", completion_file)
-    if os.path.exists(completion_path):
-        shutil.copy(completion_path, os.path.join(archive_dir, "completion.md"))
-        print(f"  ✓ Archived completion report")
-        archived_items += 1
-    else:
-        print(f"  ⚠️ No completion report found to archive")
-    
-    # Archive current directive
-    directive_file = None
-    for project in config["projects"]:
-        if project["name"] == project_name:
-            directive_file = project["directive_file"]
-            break
-    
-    if directive_file:
-        directive_path = os.path.join("MultiMindPM/directives", directive_file)
-        if os.path.exists(directive_path):
-            shutil.copy(directive_path, os.path.join(archive_dir, "directive.md"))
-            print(f"  ✓ Archived directive")
-            archived_items += 1
-        else:
-            print(f"  ⚠️ No directive file found to archive")
-    
-    # Archive status report
-    status_file = None
-    for project in config["projects"]:
-        if project["name"] == project_name:
-            status_file = project["status_file"]
-            break
-    
-    if status_file:
-        status_path = os.path.join("MultiMindPM/reports", status_file)
-        if os.path.exists(status_path):
-            shutil.copy(status_path, os.path.join(archive_dir, "status.md"))
-            print(f"  ✓ Archived status report")
-            archived_items += 1
-        else:
-            print(f"  ⚠️ No status report found to archive")
-    
-    # Archive relevant advisories
-    advisories_dir = f"MultiMindPM/advisories/{project_name}"
-    if os.path.exists(advisories_dir):
-        advisories_count = 0
-        archive_advisories_dir = os.path.join(archive_dir, "advisories")
-        os.makedirs(archive_advisories_dir, exist_ok=True)
+    # Progress lines are collected and written in one call at the end
+    log = []
+    try:
+        # Ensure archive directory exists
+        archive_dir = f"MultiMindPM/archives/{project_name}/{phase_id}"
+        _mkdirs(archive_dir)
+        archive_dir_prefix = archive_dir + "/"
         
-        for advisory_file in os.listdir(advisories_dir):
-            if advisory_file.endswith(".md"):
-                source = os.path.join(advisories_dir, advisory_file)
-                dest = os.path.join(archive_advisories_dir, advisory_file)
-                shutil.copy(source, dest)
-                advisories_count += 1
+        archived_items = 0
         
-        if advisories_count > 0:
-            print(f"  ✓ Archived {advisories_count} advisories")
+        # Archive completion report
+        completion_file = f"{project_name}-{phase_id}-complete.md"
+        completion_path = f"MultiMindPM/completions/{completion_file}"
+        if _copy_if_exists(completion_path, archive_dir_prefix + "completion.md"):
+            log.append(f"  ✓ Archived completion report")
             archived_items += 1
         else:
-            print(f"  ℹ️ No advisories found to archive")
-    
-    # Create a placeholder for phase summary
-    summary_template_path = "MultiMindPM/templates/archives/phase_summary_template.md"
-    summary_path = os.path.join(archive_dir, "phase_summary.md")
-    
-    if os.path.exists(summary_template_path):
+            log.append(f"  ⚠️ No completion report found to archive")
+        
+        # Archive current directive
+        directive_file = project["directive_file"]
+        if directive_file:
+            directive_path = f"MultiMindPM/directives/{directive_file}"
+            if _copy_if_exists(directive_path, archive_dir_prefix + "directive.md"):
+                log.append(f"  ✓ Archived directive")
+                archived_items += 1
+            else:
+                log.append(f"  ⚠️ No directive file found to archive")
+        
+        # Archive status report
+        status_file = project["status_file"]
+        if status_file:
+            status_path = f"{PM_REPORTS_DIR}/{status_file}"
+            if _copy_if_exists(status_path, archive_dir_prefix + "status.md"):
+                log.append(f"  ✓ Archived status report")
+                archived_items += 1
+            else:
+                log.append(f"  ⚠️ No status report found to archive")
+        
+        # Archive relevant advisories
+        advisories_dir = f"{PM_ADVISORIES_DIR}/{project_name}"
         try:
-            with open(summary_template_path, 'r') as src:
-                content = src.read()
-                # Replace placeholders
-                content = content.replace("[Project Name]", project_name)
-                content = content.replace("[Phase ID]", phase_id)
-                today = datetime.now().strftime('%Y-%m-%d')
-                content = content.replace("[YYYY-MM-DD]", today)
+            advisory_entries = _scan_md(advisories_dir, files_only=True)
+        except FileNotFoundError:
+            advisory_entries = None
+        
+        if advisory_entries is not None:
+            if advisory_entries:
+                # Only create the archive's advisories directory when
+                # there is something to put in it
+                archive_advisories_dir = archive_dir_prefix + "advisories"
+                _mkdirs(archive_advisories_dir)
+                archive_prefix = archive_advisories_dir + "/"
                 
-                with open(summary_path, 'w') as dest:
-                    dest.write(content)
-            
-            print(f"  ✓ Created phase summary template")
+                # The copies are independent, so let them overlap
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(advisory_entries))) as executor:
+                    list(executor.map(
+                        lambda entry: _fast_copy(entry.path, archive_prefix + entry.name, entry.stat()),
+                        advisory_entries))
+                log.append(f"  ✓ Archived {len(advisory_entries)} advisories")
+                archived_items += 1
+            else:
+                log.append(f"  ℹ️ No advisories found to archive")
+        
+        # Create a placeholder for phase summary
+        summary_template_path = "MultiMindPM/templates/archives/phase_summary_template.md"
+        summary_path = archive_dir_prefix + "phase_summary.md"
+        
+        # Basic summary written when the template is missing or unusable
+        basic_summary = (f"# Phase Summary: {project_name} - {phase_id}\n\n"
+                         f"Completion Date: {today}\n\n"
+                         f"Complete this summary with key learnings and information from the phase.\n")
+        
+        try:
+            # Loaded inside the try so an unreadable template (for example a
+            # directory) falls back to the basic summary like any other error
+            content = _load_template(summary_template_path).decode()
+            # Replace placeholders in a single pass
+            values = {"Project Name": project_name, "Phase ID": phase_id, "YYYY-MM-DD": today}
+            content = SUMMARY_PLACEHOLDER_RE.sub(lambda m: values[m.group(1)], content)
+        
+            with open(summary_path, 'w') as dest:
+                dest.write(content)
+        
+            log.append(f"  ✓ Created phase summary template")
             archived_items += 1
+        except FileNotFoundError:
+            # Create a basic summary file if template doesn't exist
+            try:
+                with open(summary_path, 'w') as f:
+                    f.write(basic_summary)
+            
+                log.append(f"  ⚠️ Created basic phase summary file (no template found)")
+                archived_items += 1
+            except Exception as e:
+                log.append(f"  ❌ Error creating basic summary file: {e}")
         except Exception as e:
-            print(f"  ❌ Error creating phase summary: {e}")
+            log.append(f"  ❌ Error creating phase summary: {e}")
             # Create a basic summary file as fallback
             try:
                 with open(summary_path, 'w') as f:
-                    f.write(f"# Phase Summary: {project_name} - {phase_id}\n\n")
-                    f.write(f"Completion Date: {datetime.now().strftime('%Y-%m-%d')}\n\n")
-                    f.write(f"Complete this summary with key learnings and information from the phase.\n")
-                print(f"  ⚠️ Created basic phase summary file (fallback)")
+                    f.write(basic_summary)
+                log.append(f"  ⚠️ Created basic phase summary file (fallback)")
                 archived_items += 1
             except Exception as e:
-                print(f"  ❌ Could not create even a basic summary file: {e}")
-    else:
-        # Create a basic summary file if template doesn't exist
-        try:
-            with open(summary_path, 'w') as f:
-                f.write(f"# Phase Summary: {project_name} - {phase_id}\n\n")
-                f.write(f"Completion Date: {datetime.now().strftime('%Y-%m-%d')}\n\n")
-                f.write(f"Complete this summary with key learnings and information from the phase.\n")
-            
-            print(f"  ⚠️ Created basic phase summary file (no template found)")
-            archived_items += 1
-        except Exception as e:
-            print(f"  ❌ Error creating basic summary file: {e}")
-    
-    if archived_items > 0:
-        print(f"✅ Phase archiving complete! Archived {archived_items} items to {archive_dir}")
-        print(f"ℹ️ Tip: Don't forget to complete the phase summary document with lessons learned and decisions made.")
-    else:
-        print(f"⚠️ Phase archiving completed but no items were successfully archived.")
-        print(f"   This may indicate missing project documentation or file access issues.")
+                log.append(f"  ❌ Could not create even a basic summary file: {e}")
+        
+        if archived_items > 0:
+            log.append(f"✅ Phase archiving complete! Archived {archived_items} items to {archive_dir}")
+            log.append(f"ℹ️ Tip: Don't forget to complete the phase summary document with lessons learned and decisions made.")
+        else:
+            log.append(f"⚠️ Phase archiving completed but no items were successfully archived.")
+            log.append(f"   This may indicate missing project documentation or file access issues.")
+    finally:
+        sys.stdout.write("".join(line + "\n" for line in log))
 
 
-def create_project_completion_script(project_name: str, project_path: str, template_content: str) -> bool:
+def create_project_completion_script(project_name: str, project_path: str,
+                                     template_parts: List[bytes] = None,
+                                     log: List[str] = None) -> bool:
     """
     Create a completion script for a specific project.
     
     Args:
         project_name: Name of the project
         project_path: Path to the project directory
-        template_content: Content of the template script
+        template_parts: Raw content of the template script split around
+            the {{PROJECT_NAME}} placeholder; read from COMPLETION_TEMPLATE
+            if not given. Callers creating several scripts should read and
+            split the template once and pass it in.
+        log: List to append output lines to instead of printing them
         
     Returns:
         bool: True if successful, False otherwise
     """
+    emit = print if log is None else log.append
+    if template_parts is None:
+        template_parts = _load_template(COMPLETION_TEMPLATE).split(b"{{PROJECT_NAME}}")
+    
     # Create scripts directory if it doesn't exist
     scripts_dir = os.path.join(project_path, "scripts")
-    os.makedirs(scripts_dir, exist_ok=True)
+    _mkdirs(scripts_dir)
     
     # Create the completion script
     script_path = os.path.join(scripts_dir, "complete_phase.py")
-    script_content = template_content.replace("{{PROJECT_NAME}}", project_name)
+    script_content = project_name.encode().join(template_parts)
     
     try:
-        with open(script_path, 'w') as f:
-            f.write(script_content)
+        # Leave an identical script untouched so sync does not rewrite it
+        # (and trigger file watchers) on every run
+        try:
+            existing = Path(script_path).read_bytes()
+        except FileNotFoundError:
+            existing = None
+        if existing == script_content:
+            if not QUIET:
+                emit(f"  ✓ Completion script for {project_name} is up to date at {script_path}")
+            return True
         
-        # Make the script executable
-        os.chmod(script_path, 0o755)
+        # Create the script executable; only a pre-existing file needs chmod
+        _write_bytes(script_path, script_content, 0o755)
+        if existing is not None:
+            os.chmod(script_path, 0o755)
         
-        print(f"  ✓ Created completion script for {project_name} at {script_path}")
+        if not QUIET:
+            emit(f"  ✓ Created completion script for {project_name} at {script_path}")
         return True
     except Exception as e:
-        print(f"  ❌ Error creating completion script for {project_name}: {e}")
+        emit(f"  ❌ Error creating completion script for {project_name}: {e}")
         return False
 
 
+def _completion_script_task(project: Dict, template_parts: List[bytes]) -> Tuple[int, List[str]]:
+    """Create one project's completion script for _run_per_project."""
+    log = []
+    created = create_project_completion_script(project["name"], project["path"],
+                                               template_parts, log)
+    return int(created), log
+
+
 def create_completion_scripts(config: Dict, project_name: str = None) -> int:
     """
     Create project-specific completion scripts.
@@ -891,17 +1383,16 @@ def create_completion_scripts(config: Dict, project_name: str = None) -> int:
         config: The configuration dictionary
         project_name: Optional name of a specific project to create script for
     """
-    template_path = "MultiMindPM/templates/complete_phase.py"
+    template_path = COMPLETION_TEMPLATE
     
-    if not os.path.exists(template_path):
+    # Load template content once for all projects, pre-split around the
+    # placeholder so each script is rendered with a single join
+    try:
+        template_parts = _load_template(template_path).split(b"{{PROJECT_NAME}}")
+    except FileNotFoundError:
         print(f"❌ Error: Completion script template not found at {template_path}")
         print(f"   Please ensure the template file exists before running this command.")
         return 0
-    
-    # Load template content
-    try:
-        with open(template_path, 'r') as f:
-            template_content = f.read()
     except Exception as e:
         print(f"❌ Error reading template file: {e}")
         return 0
@@ -911,26 +1402,20 @@ def create_completion_scripts(config: Dict, project_name: str = None) -> int:
     # Get all projects or just the specified one
     projects = []
     if project_name:
-        for project in config["projects"]:
-            if project["name"].lower() == project_name.lower():
-                projects.append(project)
-                break
+        project = find_project(config, project_name)
+        if project is not None:
+            projects.append(project)
         if not projects:
             print(f"❌ Error: Project '{project_name}' not found in config")
-            print(f"   Available projects: {', '.join(p['name'] for p in config['projects'] if is_active_project(p['name'], p['path']))}")
+            print(f"   Available projects: {', '.join(p['name'] for p in active_projects(config))}")
             return 0
     else:
         # Only include active projects (not template projects without content)
-        projects = []
-        for p in config["projects"]:
-            if is_active_project(p["name"], p["path"]):
-                projects.append(p)
+        projects = active_projects(config)
     
-    # Create scripts for each project
-    success_count = 0
-    for project in projects:
-        if create_project_completion_script(project["name"], project["path"], template_content):
-            success_count += 1
+    # Create scripts for each project concurrently
+    success_count = _run_per_project(
+        partial(_completion_script_task, template_parts=template_parts), projects)
     
     if success_count > 0:
         print(f"✅ Successfully created {success_count} completion scripts")
@@ -967,19 +1452,13 @@ def setup_directories(config: Dict) -> None:
         "output/handoffs"
     ]
     
-    for dir_path in pm_dirs:
-        os.makedirs(dir_path, exist_ok=True)
-        print(f"  - Ensured directory exists: {dir_path}")
+    all_dirs = list(pm_dirs)
     
-    # Project-specific directories
-    for project in config["projects"]:
+    # Project-specific directories (inactive template projects are skipped)
+    for project in active_projects(config):
         project_name = project["name"]
         project_path = project["path"]
         
-        # Skip inactive template projects
-        if not is_active_project(project_name, project_path):
-            continue
-            
         project_dirs = [
             os.path.join(project_path, "directives"),
             os.path.join(project_path, "reports"),
@@ -991,15 +1470,39 @@ def setup_directories(config: Dict) -> None:
             os.path.join("MultiMindPM/archives", project_name)
         ]
         
-        for dir_path in project_dirs:
-            os.makedirs(dir_path, exist_ok=True)
-            print(f"  - Ensured directory exists: {dir_path}")
+        all_dirs.extend(project_dirs)
     
+    # Create the deepest directories first; _mkdirs records their ancestors
+    # as created, so the shallower entries cost no further syscalls
+    for dir_path in sorted(set(all_dirs), key=lambda d: d.count("/"), reverse=True):
+        _mkdirs(dir_path)
+    
+    if not QUIET:
+        sys.stdout.writelines(f"  - Ensured directory exists: {d}\n" for d in all_dirs)
     print("Directory setup complete!")
 
 
-def main():
-    """Main entry point for the script."""
+def _print_version() -> None:
+    """Print version information."""
+    print(f"MultiMind v{VERSION}")
+    print("Project Orchestration Tool")
+    print("https://github.com/yourusername/multimind")
+
+
+def _load_config_for_command() -> Optional[Dict]:
+    """Load the configuration, printing a hint and returning None on failure."""
+    try:
+        return load_config()
+    except Exception as e:
+        print(f"❌ Error loading configuration: {e}")
+        print(f"   Please run './multimind.py setup' to initialize the system.")
+        return None
+
+
+def _build_parser() -> "argparse.ArgumentParser":
+    """Build the command-line parser."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description=f"MultiMind v{VERSION} - Project Orchestration Tool",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -1015,43 +1518,82 @@ Examples:
     )
     subparsers = parser.add_subparsers(dest="command", help="Commands")
     
+    # Options shared by every command that processes files
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("-q", "--quiet", action="store_true", help="Suppress per-file progress output")
+    
     # sync command
-    sync_parser = subparsers.add_parser("sync", help="Push files to projects")
+    subparsers.add_parser("sync", parents=[common], help="Push files to projects")
     
     # gather command
-    gather_parser = subparsers.add_parser("gather", help="Collect status reports and advisories")
+    subparsers.add_parser("gather", parents=[common], help="Collect status reports and advisories")
     
     # handoffs command
-    handoffs_parser = subparsers.add_parser("handoffs", help="Process handoffs between projects")
+    subparsers.add_parser("handoffs", parents=[common], help="Process handoffs between projects")
     
     # complete command
-    complete_parser = subparsers.add_parser("complete", help="Report project phase completion")
+    complete_parser = subparsers.add_parser("complete", parents=[common], help="Report project phase completion")
     complete_parser.add_argument("project_name", help="Name of the project reporting completion")
     complete_parser.add_argument("phase_id", help="Identifier for the completed phase (e.g., Phase1)")
     complete_parser.add_argument("--only-project", action="store_true", help="Only show completions for the specified project")
     
     # init command
-    init_parser = subparsers.add_parser("init", help="Initialize a new project")
+    init_parser = subparsers.add_parser("init", parents=[common], help="Initialize a new project")
     init_parser.add_argument("project_name", help="Name of the new project")
     
     # advisories command
-    advisories_parser = subparsers.add_parser("advisories", help="Process advisories between PM and projects")
+    subparsers.add_parser("advisories", parents=[common], help="Process advisories between PM and projects")
     
     # archive command
-    archive_parser = subparsers.add_parser("archive", help="Archive a completed phase")
+    archive_parser = subparsers.add_parser("archive", parents=[common], help="Archive a completed phase")
     archive_parser.add_argument("project_name", help="Name of the project")
     archive_parser.add_argument("phase_id", help="Identifier for the completed phase (e.g., Phase1)")
     
     # setup command
-    setup_parser = subparsers.add_parser("setup", help="Setup all required directories")
+    subparsers.add_parser("setup", parents=[common], help="Setup all required directories")
     
     # create-scripts command
-    scripts_parser = subparsers.add_parser("create-scripts", help="Create completion scripts for projects")
+    scripts_parser = subparsers.add_parser("create-scripts", parents=[common], help="Create completion scripts for projects")
     scripts_parser.add_argument("--project", help="Name of a specific project to create script for")
     
     # version command
-    version_parser = subparsers.add_parser("version", help="Display version information")
+    subparsers.add_parser("version", help="Display version information")
+    
+    return parser
+
+
+# Command handlers, called with the loaded config and the parsed arguments
+COMMANDS = {
+    "sync": lambda config, args: sync_files(config),
+    "gather": lambda config, args: gather_reports(config),
+    "handoffs": lambda config, args: handle_handoffs(config),
+    "complete": lambda config, args: report_completion(config, args.project_name, args.phase_id,
+                                                       args.only_project),
+    "init": lambda config, args: init_project(config, args.project_name),
+    "advisories": lambda config, args: handle_advisories(config),
+    "archive": lambda config, args: archive_phase(config, args.project_name, args.phase_id),
+    "setup": lambda config, args: setup_directories(config),
+    "create-scripts": lambda config, args: create_completion_scripts(config, args.project),
+}
+
+# Commands without arguments; run bare, they skip the argument parser
+SIMPLE_COMMANDS = frozenset(("sync", "gather", "handoffs", "advisories", "setup"))
+
+
+def main():
+    """Main entry point for the script."""
+    # Fast path: a bare command with no options needs no argument parser
+    argv = sys.argv[1:]
+    if argv == ["version"]:
+        _print_version()
+        return
+    if len(argv) == 1 and argv[0] in SIMPLE_COMMANDS:
+        config = _load_config_for_command()
+        if config is not None:
+            COMMANDS[argv[0]](config, None)
+        return
     
+    parser = _build_parser()
     args = parser.parse_args()
     
     if not args.command:
@@ -1060,39 +1602,22 @@ Examples:
     
     # Handle version command first (no config needed)
     if args.command == "version":
-        print(f"MultiMind v{VERSION}")
-        print("Project Orchestration Tool")
-        print("https://github.com/yourusername/multimind")
+        _print_version()
         return
     
     # All other commands need config
-    try:
-        config = load_config()
-    except Exception as e:
-        print(f"❌ Error loading configuration: {e}")
-        print(f"   Please run './multimind.py setup' to initialize the system.")
+    config = _load_config_for_command()
+    if config is None:
         return
     
-    if args.command == "sync":
-        sync_files(config)
-    elif args.command == "gather":
-        gather_reports(config)
-    elif args.command == "handoffs":
-        handle_handoffs(config)
-    elif args.command == "complete":
-        report_completion(config, args.project_name, args.phase_id, args.only_project)
-    elif args.command == "init":
-        init_project(config, args.project_name)
-    elif args.command == "advisories":
-        handle_advisories(config)
-    elif args.command == "archive":
-        archive_phase(config, args.project_name, args.phase_id)
-    elif args.command == "setup":
-        setup_directories(config)
-    elif args.command == "create-scripts":
-        create_completion_scripts(config, args.project)
-    else:
+    global QUIET
+    QUIET = args.quiet
+    
+    handler = COMMANDS.get(args.command)
+    if handler is None:
         parser.print_help()
+        return
+    handler(config, args)
 
 
 if __name__ == "__main__":